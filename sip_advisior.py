@@ -1,10 +1,19 @@
+import io
+import os
+import re
+import tempfile
+import time
+import types
+from pathlib import Path
 import streamlit as st
+import numpy as np
+import orjson
 import pandas as pd
 import requests
 import plotly.graph_objects as go
-from fuzzywuzzy import process
-from transformers import pipeline
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from rapidfuzz import fuzz, process, utils
 
 # Set Streamlit page config
 st.set_page_config(page_title="SIP Advisor", layout="wide")
@@ -24,10 +33,7 @@ Data source: Free Mutual Fund APIs (MFAPI.in)
 """)
 
 # --- Static FAQ Chatbot ---
-st.subheader("\U0001F916 SIP Assistant (FAQs)")
-faq_input = st.text_input("Ask your SIP-related question", "What is SIP?")
-
-faq_answers = {
+FAQ_ANSWERS = types.MappingProxyType({
     "what is sip": "A SIP or Systematic Investment Plan is a way to invest in mutual funds regularly.",
     "benefits of sip": "SIPs help inculcate financial discipline, average out costs via rupee cost averaging, and harness power of compounding.",
     "types of sip": "There are types like Regular SIP, Top-up SIP, Flexible SIP, and Perpetual SIP.",
@@ -41,154 +47,364 @@ faq_answers = {
     "how much should i invest": "You should invest as per your financial goals and monthly saving capability.",
     "which sip is best": "There is no one-size-fits-all. Best SIP depends on your investment horizon and risk appetite.",
     "is sip tax free": "Returns from SIPs in equity funds are taxed as per capital gains tax rules. ELSS offers tax benefits under 80C."
-}
+})
+
+@st.cache_resource
+def get_faq_keys():
+    keys = tuple(FAQ_ANSWERS)
+    # Normalise the keys once so the scorer doesn't redo it on every lookup
+    return keys, tuple(utils.default_process(k) for k in keys)
 
-matched = process.extractOne(faq_input.lower(), faq_answers.keys())
-if matched and matched[1] > 70:
-    st.success(faq_answers[matched[0]])
-else:
-    st.info("I'm here to help with SIPs! Try asking: 'What is SIP?', 'Benefits of SIP', or 'Types of SIPs'")
+@st.cache_data(max_entries=256, show_spinner=False)
+def best_faq(question):
+    faq_keys, faq_keys_norm = get_faq_keys()
+    matched = process.extractOne(utils.default_process(question), faq_keys_norm, scorer=fuzz.WRatio, processor=None, score_cutoff=70)
+    return faq_keys[matched[2]] if matched else None
 
 # --- SIP Calculator ---
-st.subheader("\U0001F4CA SIP Return Calculator")
-sip_amt = st.number_input("Monthly SIP Amount (₹)", value=1000, step=500)
-sip_years = st.slider("Investment Duration (years)", 1, 30, 10)
-expected_return = st.slider("Expected Annual Return (%)", 1, 20, 12)
+def sip_future_value(amt, monthly_rate, n_months):
+    # Works on scalars and on broadcast NumPy arrays alike; expm1/log1p keeps
+    # (1 + r) ** n - 1 accurate when the monthly rate is small
+    return amt * (np.expm1(n_months * np.log1p(monthly_rate)) * (1 + monthly_rate)) / monthly_rate
 
-if st.button("Calculate SIP Return"):
-    n_months = sip_years * 12
-    monthly_rate = expected_return / 100 / 12
-    future_value = sip_amt * (((1 + monthly_rate) ** n_months - 1) * (1 + monthly_rate)) / monthly_rate
-    invested = sip_amt * n_months
-    gain = future_value - invested
+@st.cache_data
+def sip_summary(amt, n_months, expected_return):
+    future_value = float(sip_future_value(amt, expected_return / 100 / 12, n_months))
+    invested = amt * n_months
+    return invested, future_value - invested, future_value
 
-    st.success(f"Total Invested: ₹{invested:,.0f}")
-    st.success(f"Expected Return: ₹{gain:,.0f}")
-    st.success(f"Maturity Value: ₹{future_value:,.0f}")
+# --- Recommendation & Data Helpers ---
+NER_MODEL = "Davlan/distilbert-base-multilingual-cased-ner-hrl"
 
-# --- SIP Search ---
-st.subheader("\U0001F50D Search SIP Mutual Funds")
-st.markdown("Enter AMC Name, Fund Category (e.g., ELSS, Large Cap), or Scheme Name")
-user_query = st.text_input("Search", "Large Cap")
+@st.cache_resource
+def get_ner():
+    # torch/transformers are heavy to import, so only pay for them when NER is actually needed
+    import torch
+    from transformers import pipeline
 
-# --- Smart Recommendations ---
-st.markdown("### \U0001F4A1 Smart Top 3 SIP Suggestions")
+    if torch.cuda.is_available():
+        ner = pipeline("ner", model=NER_MODEL, aggregation_strategy="simple", device=0, torch_dtype=torch.float16)
+    else:
+        ner = pipeline("ner", model=NER_MODEL, aggregation_strategy="simple", device=-1)
+        # int8 dynamic quantization of the Linear layers for CPU inference
+        ner.model = torch.ao.quantization.quantize_dynamic(ner.model, {torch.nn.Linear}, dtype=torch.qint8)
+    # Search queries are a handful of tokens; keep the padded length small
+    ner.tokenizer.model_max_length = 64
+    # Warm up once so the first user query doesn't pay the one-off init cost
+    ner("HDFC Mutual Fund")
+    return ner
 
-nlp_model = pipeline("ner", model="dbmdz/bert-large-cased-finetuned-conll03-english", device=-1)
+PCT_RE = re.compile(r"(\d+(?:\.\d+)?)\s*%")
+DUR_RE = re.compile(r"(\d+)\s*(m|months?|y|yrs?|years?)\b", re.I)
 
-@st.cache_data
+def extract_entities(query):
+    entities = {}
+    percent = PCT_RE.search(query)
+    if percent:
+        entities['percent'] = float(percent.group(1))
+    duration = DUR_RE.search(query)
+    if duration:
+        months = int(duration.group(1))
+        entities['months'] = months * 12 if duration.group(2).lower().startswith("y") else months
+    # Only fall back to the NER model when none of the regexes matched
+    if not entities:
+        try:
+            entities['orgs'] = [e['word'] for e in get_ner()(query) if e['entity_group'] == "ORG"]
+        except Exception:
+            # torch/transformers or the model hub unavailable: no NER-based suggestions
+            entities['orgs'] = []
+    return entities
+
+@st.cache_resource
+def get_session():
+    # Module globals are rebuilt on every script rerun; caching the session keeps its
+    # keep-alive connections (and their TLS handshakes) alive across reruns
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(max_retries=Retry(total=2, backoff_factor=0.3)))
+    return session
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_nav(scheme_code):
+    response = get_session().get(f"https://api.mfapi.in/mf/{scheme_code}", timeout=5)
+    response.raise_for_status()
+    raw = orjson.loads(response.content).get('data', [])
+    # MFAPI dates are dd-mm-yyyy; reorder to ISO so numpy can parse them directly
+    dates = np.array([f"{r['date'][6:]}-{r['date'][3:5]}-{r['date'][:2]}" for r in raw], dtype='datetime64[D]')
+    navs = np.fromiter((float(r['nav']) for r in raw), dtype=np.float64, count=len(raw))
+    # MFAPI lists newest first, so a reversed view is usually all that's needed
+    if len(dates) and dates[0] > dates[-1]:
+        dates, navs = dates[::-1], navs[::-1]
+    if np.any(dates[1:] < dates[:-1]):
+        order = np.argsort(dates, kind='stable')
+        dates, navs = dates[order], navs[order]
+    return dates, navs
+
+# Calendar-approximate lookback windows, in days
+PERIOD_DAYS = {"1m": 30, "3m": 91, "6m": 182, "1y": 365, "2y": 730, "3y": 1095, "5y": 1825}
+
+def period_return(dates, navs, start_date=None):
+    # dates is sorted, so the period start is a binary search rather than a mask
+    start = 0 if start_date is None else np.searchsorted(dates, start_date)
+    if len(navs) - start < 2:
+        return None
+    return (navs[-1] / navs[start] - 1.0) * 100.0
+
+CACHE_DIR = Path.home() / ".cache" / "sip_advisor"
+DISK_CACHE_TTL = 86400
+
+def read_disk_cache(path, **read_kwargs):
+    # Best effort: a missing, stale or unreadable file just means "fetch again"
+    try:
+        if path.exists() and time.time() - path.stat().st_mtime < DISK_CACHE_TTL:
+            return pd.read_parquet(path, **read_kwargs)
+    except Exception:
+        pass
+    return None
+
+def write_disk_cache(df, path):
+    # Best effort as well: the disk copy is only an optimisation over a fresh download
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file unique to this writer, then rename, so a concurrent
+        # reader never sees a half-written file and writers don't clobber each other
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as tmp:
+            tmp_path = tmp.name
+        try:
+            df.to_parquet(tmp_path, compression="zstd")
+            os.replace(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+    except Exception:
+        pass
+
+@st.cache_data(ttl=86400)
 def fetch_fund_data():
+    # Failures raise: st.cache_data doesn't store exceptions, so a transient
+    # MFAPI error isn't kept for a day
     url = "https://api.mfapi.in/mf"
+    cache_path = CACHE_DIR / "mf_list.parquet"
+    cached = read_disk_cache(cache_path, dtype_backend="pyarrow")
+    if cached is not None:
+        return cached
+    response = get_session().get(url, timeout=10)
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    # Arrow-backed columns: compact string buffers and Arrow compute kernels for str.contains
+    df = pd.DataFrame(data).convert_dtypes(dtype_backend="pyarrow")
+    df['schemeNameLower'] = df['schemeName'].str.lower()
+    write_disk_cache(df, cache_path)
+    return df
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_fund_data_or_empty():
+    # As with Nifty, a failure is remembered for a few minutes rather than retried on every rerun
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-        return pd.DataFrame(data)
-    except:
+        return fetch_fund_data()
+    except Exception:
         return pd.DataFrame([])
 
+@st.cache_data(ttl=86400)
 def fetch_nifty_data():
+    # Failures raise instead of returning an empty frame: st.cache_data doesn't store
+    # exceptions, so a failed download isn't kept for a day
+    cache_path = CACHE_DIR / "nifty.parquet"
+    cached = read_disk_cache(cache_path)
+    if cached is not None:
+        return cached
+    url = "https://query1.finance.yahoo.com/v7/finance/download/^NSEI"
+    params = {"period1": 0, "period2": 9999999999, "interval": "1d", "events": "history"}
+    response = get_session().get(url, params=params, timeout=10)
+    response.raise_for_status()
+    df = pd.read_csv(io.BytesIO(response.content), usecols=['Date', 'Close'])
+    df = df.rename(columns={"Close": "Nifty_Close"})
+    df['Date'] = pd.to_datetime(df['Date'], format='%Y-%m-%d', cache=True).astype('datetime64[ns]')
+    df = df.sort_values('Date', ignore_index=True)
+    write_disk_cache(df, cache_path)
+    return df
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_nifty_or_empty():
+    # Remember a failure for a few minutes only, so an unreachable Yahoo doesn't
+    # stall every rerun on the download timeout, yet the chart recovers soon after
     try:
-        url = "https://query1.finance.yahoo.com/v7/finance/download/^NSEI?period1=0&period2=9999999999&interval=1d&events=history"
-        df = pd.read_csv(url)
-        df = df[['Date', 'Close']].rename(columns={"Close": "Nifty_Close"})
-        df['Date'] = pd.to_datetime(df['Date']).dt.strftime('%Y-%m-%d')
-        return df
-    except:
+        return fetch_nifty_data()
+    except Exception:
         return pd.DataFrame()
 
-def get_top_schemes_based_on_input(query, funds_df):
-    query = query.lower()
-    if "elss" in query or "tax" in query:
-        return funds_df[funds_df['schemeName'].str.lower().str.contains("elss")].head(3)
-    elif "large cap" in query:
-        return funds_df[funds_df['schemeName'].str.lower().str.contains("large cap")].head(3)
-    elif "12%" in query and ("6m" in query or "6 months" in query):
-        return funds_df[funds_df['schemeName'].str.lower().str.contains("growth")].head(3)
+def search_funds(funds_df, query_lc):
+    matches = funds_df[funds_df['schemeNameLower'].str.contains(query_lc, regex=False, na=False)]
+    terms = query_lc.split()
+    if matches.empty and len(terms) > 1:
+        # Multi-term query such as "hdfc elss": every term must appear, in any order.
+        # Longest term first, and each later term only scans the rows that survived.
+        matches = funds_df
+        for term in sorted(terms, key=len, reverse=True):
+            matches = matches[matches['schemeNameLower'].str.contains(term, regex=False, na=False)]
+            if matches.empty:
+                break
+    return matches
+
+def get_top_schemes_based_on_input(query, query_lc, funds_df, matches):
+    if "elss" in query_lc or "tax" in query_lc:
+        return funds_df[funds_df['schemeNameLower'].str.contains("elss", regex=False, na=False)].head(3)
+    elif "large cap" in query_lc:
+        return funds_df[funds_df['schemeNameLower'].str.contains("large cap", regex=False, na=False)].head(3)
+    elif not matches.empty:
+        # The query already names schemes directly; no need to run the NER model
+        return matches.head(3)
+
+    entities = extract_entities(query)
+    if entities.get('percent') == 12 and entities.get('months') == 6:
+        return funds_df[funds_df['schemeNameLower'].str.contains("growth", regex=False, na=False)].head(3)
+    elif entities.get('orgs'):
+        return funds_df[funds_df['schemeNameLower'].str.contains(entities['orgs'][0].lower(), regex=False, na=False)].head(3)
     else:
         return pd.DataFrame()
 
-funds = fetch_fund_data()
-nifty_df = fetch_nifty_data()
+CHART_POINTS = 1000
+
+def downsample_lttb(x, y, n_out=CHART_POINTS):
+    # Largest-Triangle-Three-Buckets: returns the indices of the points to keep
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_lo, next_hi = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x, avg_y = x[next_lo:next_hi].mean(), y[next_lo:next_hi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + np.argmax(area)
+        idx[i + 1] = a
+    return idx
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def build_nav_figure(scheme_name, dates_bytes, navs_bytes, nifty_df):
+    # Keyed on the raw array bytes and the Nifty frame, so an unchanged NAV history reuses
+    # the built figure but refreshed Nifty data rebuilds it; bounded, as each figure is large
+    dates = np.frombuffer(dates_bytes, dtype='datetime64[D]')
+    navs = np.frombuffer(navs_bytes, dtype=np.float64)
+
+    # Thin long histories before plotting; the shape is kept but the browser draws far fewer points
+    keep = downsample_lttb(dates.astype(np.float64), navs)
+
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(x=dates[keep], y=navs[keep], mode='lines', name=f"{scheme_name} NAV"))
+
+    if not nifty_df.empty:
+        nav_df = pd.DataFrame({'date': dates.astype('datetime64[ns]'), 'nav': navs})
+        merged = pd.merge_asof(nav_df, nifty_df, left_on='date', right_on='Date', direction='nearest', tolerance=pd.Timedelta('1D'))
+        fig.add_trace(go.Scattergl(x=merged['date'].to_numpy()[keep], y=merged['Nifty_Close'].to_numpy()[keep], mode='lines', name='Nifty 50 Index', hoverinfo='skip'))
+
+    fig.update_layout(
+        title=f"NAV vs Nifty - {scheme_name}",
+        xaxis_title="Date",
+        yaxis_title="Value",
+        # Keyed on the scheme, so zoom/pan survives reruns but resets for a different fund
+        uirevision=scheme_name
+    )
+    return fig
+
+@st.fragment
+def faq_section():
+    st.subheader("\U0001F916 SIP Assistant (FAQs)")
+    faq_input = st.text_input("Ask your SIP-related question", "What is SIP?")
+
+    matched = best_faq(faq_input)
+    if matched:
+        st.success(FAQ_ANSWERS[matched])
+    else:
+        st.info("I'm here to help with SIPs! Try asking: 'What is SIP?', 'Benefits of SIP', or 'Types of SIPs'")
 
-if not funds.empty:
-    filtered = funds[funds.apply(lambda row: user_query.lower() in row['schemeName'].lower(), axis=1)]
-    if not filtered.empty:
-        selected_scheme = filtered.iloc[0]
-        scheme_code = selected_scheme['schemeCode']
-        scheme_name = selected_scheme['schemeName']
+@st.fragment
+def calc_section():
+    st.subheader("\U0001F4CA SIP Return Calculator")
+    sip_amt = st.number_input("Monthly SIP Amount (₹)", value=1000, step=500)
+    sip_years = st.slider("Investment Duration (years)", 1, 30, 10)
+    expected_return = st.slider("Expected Annual Return (%)", 1, 20, 12)
 
-        top_schemes = get_top_schemes_based_on_input(user_query, funds)
+    if st.button("Calculate SIP Return"):
+        invested, gain, future_value = sip_summary(sip_amt, sip_years * 12, expected_return)
+
+        st.success(f"Total Invested: ₹{invested:,.0f}")
+        st.success(f"Expected Return: ₹{gain:,.0f}")
+        st.success(f"Maturity Value: ₹{future_value:,.0f}")
+
+        rates = np.arange(1, 21)
+        years = np.arange(1, 31)
+        grid = sip_future_value(sip_amt, rates[:, None] / 1200.0, years[None, :] * 12)
+        heatmap = go.Figure(go.Heatmap(z=grid, x=years, y=rates, colorbar_title="Maturity (₹)"))
+        heatmap.update_layout(title="Maturity Value by Duration and Return", xaxis_title="Years", yaxis_title="Annual Return (%)")
+        st.plotly_chart(heatmap, use_container_width=True)
+
+@st.fragment
+def search_section():
+    # --- SIP Search ---
+    st.subheader("\U0001F50D Search SIP Mutual Funds")
+    st.markdown("Enter AMC Name, Fund Category (e.g., ELSS, Large Cap), or Scheme Name")
+    user_query = st.text_input("Search", "Large Cap")
+
+    # --- Smart Recommendations ---
+    st.markdown("### \U0001F4A1 Smart Top 3 SIP Suggestions")
+
+    funds = fetch_fund_data_or_empty()
+    if not funds.empty:
+        # Lowercase once; the original casing is kept only for the cased NER fallback
+        query_lc = user_query.lower().strip()
+        filtered = search_funds(funds, query_lc)
+
+        top_schemes = get_top_schemes_based_on_input(user_query, query_lc, funds, filtered)
         if not top_schemes.empty:
             for _, row in top_schemes.iterrows():
                 st.markdown(f"**{row['schemeName']}**  ")
 
-        st.subheader(f"Selected Scheme: {scheme_name}")
+        if not filtered.empty:
+            selected_scheme = filtered.iloc[0]
+            scheme_code = selected_scheme['schemeCode']
+            scheme_name = selected_scheme['schemeName']
 
-        detail_url = f"https://api.mfapi.in/mf/{scheme_code}"
-        try:
-            detail = requests.get(detail_url).json()
-            if 'data' in detail and len(detail['data']) >= 30:
-                navs = pd.DataFrame(detail['data'])
-                navs['date'] = pd.to_datetime(navs['date'])
-                navs['nav'] = navs['nav'].astype(float)
-                navs = navs.sort_values('date')
-
-                col1, col2 = st.columns([1, 2])
-                with col1:
-                    return_period = st.selectbox("\U0001F552 Return Comparison Period", ["1y", "1m", "3m", "6m", "2y", "3y", "5y", "till date"], index=0)
-
-                period_mapping = {
-                    "1m": pd.DateOffset(months=1),
-                    "3m": pd.DateOffset(months=3),
-                    "6m": pd.DateOffset(months=6),
-                    "1y": pd.DateOffset(years=1),
-                    "2y": pd.DateOffset(years=2),
-                    "3y": pd.DateOffset(years=3),
-                    "5y": pd.DateOffset(years=5),
-                    "till date": None
-                }
-
-                if return_period != "till date":
-                    start_date = navs['date'].max() - period_mapping[return_period]
-                    navs_filtered = navs[navs['date'] >= start_date]
-                else:
-                    navs_filtered = navs.copy()
+            st.subheader(f"Selected Scheme: {scheme_name}")
 
-                if len(navs_filtered) > 1:
-                    selected_return = (navs_filtered.iloc[-1]['nav'] - navs_filtered.iloc[0]['nav']) / navs_filtered.iloc[0]['nav'] * 100
-                    signal = "Buy" if selected_return > 14 else "Hold" if selected_return > 10 else "Sell"
+            try:
+                dates, navs = fetch_nav(scheme_code)
+                if len(navs) >= 30:
+                    col1, col2 = st.columns([1, 2])
+                    with col1:
+                        return_period = st.selectbox("\U0001F552 Return Comparison Period", ["1y", "1m", "3m", "6m", "2y", "3y", "5y", "till date"], index=0)
 
-                    with col2:
-                        st.metric(label=f"{return_period} Return", value=f"{selected_return:.2f}%", delta=signal)
+                    start_date = None
+                    if return_period != "till date":
+                        start_date = dates[-1] - np.timedelta64(PERIOD_DAYS[return_period], 'D')
 
-                    fig = go.Figure()
-                    fig.add_trace(go.Scatter(x=navs['date'], y=navs['nav'], mode='lines', name=f"{scheme_name} NAV"))
+                    selected_return = period_return(dates, navs, start_date)
+                    if selected_return is not None:
+                        signal = "Buy" if selected_return > 14 else "Hold" if selected_return > 10 else "Sell"
 
-                    if not nifty_df.empty:
-                        merged = pd.merge(navs, nifty_df, left_on=navs['date'].dt.strftime('%Y-%m-%d'), right_on='Date', how='left')
-                        fig.add_trace(go.Scatter(x=merged['date'], y=merged['Nifty_Close'], mode='lines', name='Nifty 50 Index'))
+                        with col2:
+                            st.metric(label=f"{return_period} Return", value=f"{selected_return:.2f}%", delta=signal)
 
-                    fig.update_layout(
-                        title=f"NAV vs Nifty - {scheme_name}",
-                        xaxis_title="Date",
-                        yaxis_title="Value",
-                        xaxis_rangeslider_visible=True
-                    )
-                    st.plotly_chart(fig, use_container_width=True)
+                        st.plotly_chart(build_nav_figure(scheme_name, dates.tobytes(), navs.tobytes(), fetch_nifty_or_empty()), use_container_width=True)
 
-                    st.subheader("Buy/Hold/Sell Signal")
-                    st.write(f"Recommendation: {signal}")
+                        st.subheader("Buy/Hold/Sell Signal")
+                        st.write(f"Recommendation: {signal}")
+                    else:
+                        st.warning("Not enough data for the selected period.")
                 else:
-                    st.warning("Not enough data for the selected period.")
-            else:
-                st.warning("Not enough data to calculate signals.")
-        except Exception as e:
-            st.error(f"Error fetching data for {scheme_name}: {e}")
+                    st.warning("Not enough data to calculate signals.")
+            except Exception as e:
+                st.error(f"Error fetching data for {scheme_name}: {e}")
+        else:
+            st.warning("No schemes found matching your search.")
     else:
-        st.warning("No schemes found matching your search.")
-else:
-    st.warning("Live fund list could not be loaded. Try again later.")
+        st.warning("Live fund list could not be loaded. Try again later.")
+
+faq_section()
+calc_section()
+search_section()
 
 # --- Coming Soon Section ---
 st.markdown("---")